@@ -36,82 +36,168 @@ English as root and other language(s) as subdirectories:
 -------------------------------------------------------------------------------
 """
 
-import argparse
-import re
+import bisect
+import concurrent.futures
+import functools
+import os
+import sys
+
+try:
+    # Optional: google's re2 guarantees linear-time matching.
+    import re2 as re
+except ImportError:
+    import re
+
 from pathlib import Path
 from typing import List
 
+_LINK_RE = re.compile(r"\[[^\]\n]*\]\((([^)\n#]*)(?:#([^)\n]*))?)\)")
+_EXTERNAL_RE = re.compile(r"https*://")
+_HTML_ANCHOR_RE = re.compile(rb'<a name="([^"]+)">')
+_HEADING_RE = re.compile(rb'^#+\s+(.+?)\s*$', re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=4096)
+def _exists(path_str: str) -> bool:
+    """Cache existence checks to avoid repeated stat() syscalls
+
+    Many links usually point to the same few target files.
+    """
+    return os.path.exists(path_str)
+
+
+@functools.lru_cache(maxsize=256)
+def _read(path_str: str) -> bytes:
+    """Read a file once, then serve repeated reads from the cache
+
+    Many links usually point into the same few target files.
+    The content stays undecoded: anchor scanning is pure ASCII
+    substring work, so decoding the file would only cost time
+    and memory.
+    """
+    return Path(path_str).read_bytes()
+
+
+@functools.lru_cache(maxsize=256)
+def _anchors_of(path_str: str) -> frozenset:
+    """Collect all anchors a file defines, lowercased for lookup
+
+    Anchors are html anchors '<a name="...">' and Markdown headings.
+    The file is scanned only once, no matter how many links point
+    into it; each link then costs one set lookup.
+    """
+    content_lower = _read(path_str).lower()
+    anchors = _HTML_ANCHOR_RE.findall(content_lower)
+    anchors += _HEADING_RE.findall(content_lower)
+    return frozenset(anchors)
+
+
+@functools.lru_cache(maxsize=1024)
+def _rewrite_raspibackupdoc(target: str) -> str:
+    """Map a raspiBackupDoc link onto the symmetric source layout
+
+    The same few cross-language targets recur constantly, hence the
+    cache.
+    """
+    if target.startswith("../"):
+        return "../../en/src/" + target[3:]
+    if target.startswith("de/"):
+        return "../../de/src/" + target[3:]
+    return target
+
+
+def _anchor_defined(path_str: str, anchor: str) -> bool:
+    """Check if target file defines the given anchor """
+
+    return anchor.lower().encode() in _anchors_of(path_str)
+
 
 def check_anchor_in_target_file(target: Path,
                                 anchor, is_local_anchor,
-                                file: Path, line_number) -> None:
+                                file_posix: str, line_number,
+                                diagnostics: list) -> None:
     """Check if given anchor is in target file
 
      - as an html anchor "<a name="...">
      - as Markdown heading "# ..."
+
+    Findings are appended to list diagnostics.
     """
-    content = target.read_text()
+    target_posix = target.as_posix()
+    content = _read(target_posix)
+
+    # The unquoted variants are literal strings, so plain substring
+    # search is sufficient (and much faster than the regex engine).
+    anchor_unquoted = f"<a name={anchor}>"
+    unquoted_start = content.find(anchor_unquoted.encode())
+    if unquoted_start == -1:
+        anchor_unquoted = f"<a name='{anchor}'>"
+        unquoted_start = content.find(anchor_unquoted.encode())
 
-    m_anchor_dblquoted = re.search(rf'<a name="{anchor}">', content)
-    m_anchor_unquoted = re.search(rf"<a name=({anchor}|'{anchor}')>", content)
-    m_title = re.search(f'^##* {anchor}', content,
-                        re.IGNORECASE | re.MULTILINE)
+    found = _anchor_defined(target_posix, anchor)
 
     if is_local_anchor:
-        if m_anchor_unquoted:
-            target_line_nr = content[:m_anchor_unquoted.start()].count("\n")+1
-            print(f"{file.as_posix()}:{line_number}:"
-                  f" Anchor name is not double-quoted"
-                  f" in line {target_line_nr}:"
-                  f" {m_anchor_unquoted.group(0)}")
+        if unquoted_start != -1:
+            target_line_nr = content[:unquoted_start].count(b"\n")+1
+            diagnostics.append(
+                f"{file_posix}:{line_number}:"
+                f" Anchor name is not double-quoted"
+                f" in line {target_line_nr}:"
+                f" {anchor_unquoted}\n")
         else:
-            if m_anchor_dblquoted or m_title:
+            if found:
                 return
-            print(f"{file.as_posix()}:{line_number}:"
-                  f" Anchor/target '{anchor}' not found!")
+            diagnostics.append(
+                f"{file_posix}:{line_number}:"
+                f" Anchor/target '{anchor}' not found!\n")
     else:
-        if m_anchor_unquoted:
-            target_line_nr = content[:m_anchor_unquoted.start()].count("\n")+1
-            print(f"{file.as_posix()}:{line_number}:"
-                  f" Anchor name is not double-quoted"
-                  f" in target file '{target.as_posix()}:{target_line_nr}':"
-                  f" {m_anchor_unquoted.group(0)}")
+        if unquoted_start != -1:
+            target_line_nr = content[:unquoted_start].count(b"\n")+1
+            diagnostics.append(
+                f"{file_posix}:{line_number}:"
+                f" Anchor name is not double-quoted"
+                f" in target file '{target_posix}:{target_line_nr}':"
+                f" {anchor_unquoted}\n")
         else:
-            if m_anchor_dblquoted or m_title:
+            if found:
                 return
-            print(f"{file.as_posix()}:{line_number}:"
-                  f" Anchor/target '{anchor}' not found"
-                  f" in target file '{target.as_posix()}'!")
+            diagnostics.append(
+                f"{file_posix}:{line_number}:"
+                f" Anchor/target '{anchor}' not found"
+                f" in target file '{target_posix}'!\n")
 
 
 def check_markdown_file(root: Path, file: Path,
-                        raspibackupdoc=False,
-                        external_links=None) -> None:
+                        raspibackupdoc=False) -> tuple:
     """Check Markdown file for broken project-internal links
 
-    Collect possible external links in list external_links
-    as [(file.as_posix(), line_number, target), ...]
+    Return a tuple (external_links, diagnostics): possible external
+    links as set {(file.as_posix(), line_number, target), ...} and
+    the findings as list of preformatted lines.
     """
 
-    with file.open() as f:
-        lines = f.readlines()
+    external_links: set[tuple] = set()
+    diagnostics: List[str] = []
 
-    for line_number, line in enumerate(lines, start=1):
-        line = line.strip()
-        m = re.search(r"\[.*?\]\((.*?)\)", line)
-        if not m:
-            continue
+    file_posix = file.as_posix()
+    text = file.read_text(encoding="utf-8")
 
-        target = m.groups()[0]
+    # Positions of all newlines; a link at offset i is on line
+    # bisect_right(newlines, i) + 1.
+    newlines = []
+    pos = text.find("\n")
+    while pos != -1:
+        newlines.append(pos)
+        pos = text.find("\n", pos + 1)
 
-        if re.match(r"https*://", target):
-            external_links.append((file.as_posix(), line_number, target))
-            continue
+    for m in _LINK_RE.finditer(text):
+        line_number = bisect.bisect_right(newlines, m.start()) + 1
+
+        target, anchor = m.group(2), m.group(3) or ""
 
-        try:
-            target, anchor = target.split("#")
-        except ValueError:
-            anchor = ""
+        if _EXTERNAL_RE.match(target):
+            external_links.add((file_posix, line_number, m.group(1)))
+            continue
 
         if target == "":   # the current file itself
             target_path = file
@@ -121,45 +207,78 @@ def check_markdown_file(root: Path, file: Path,
 
             if raspibackupdoc:
                 # special handling for raspiBackupDoc
-                if target.startswith("../"):
-                    target = "../../en/src/" + target[3:]
-                elif target.startswith("de/"):
-                    target = "../../de/src/" + target[3:]
-                # end special handling
+                target = _rewrite_raspibackupdoc(target)
 
             target_path = root / target
 
-        if not target_path.exists():
-            print(f"{file.as_posix()}:{line_number}:"
-                  f" Target file not found: '{target_path.as_posix()}'")
+        target_posix = target_path.as_posix()
+        if not _exists(target_posix):
+            diagnostics.append(
+                f"{file_posix}:{line_number}:"
+                f" Target file not found: '{target_posix}'\n")
             continue
 
         if anchor:
             check_anchor_in_target_file(target_path,
                                         anchor, is_local_anchor,
-                                        file, line_number)
+                                        file_posix, line_number,
+                                        diagnostics)
+
+    return external_links, diagnostics
+
+
+def _iter_md_files(dir_str: str):
+    """Yield the paths of all Markdown files below dir_str
+
+    os.scandir hands out DirEntry objects with cached type
+    information, so walking costs no extra stat() and no Path
+    object per visited entry.
+    """
+    try:
+        with os.scandir(dir_str) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from _iter_md_files(entry.path)
+                elif entry.name.endswith((".md", ".mkd", ".markdown")):
+                    yield entry.path
+    except OSError as error:
+        print(error)
 
 
 def walk_dir(directory: Path, raspibackupdoc=False,
-             external_links=None, verbose=False) -> None:
-    """Traverse given directory and check Markdown files """
-
-    for root, _, files in Path(directory).walk(on_error=print):
-        if verbose:
-            print(">>> Checking directory", root)
-        for f in files:
-            file = root / f
-            if file.suffix not in (".md", ".mkd", ".markdown"):
-                continue
-            if verbose:
-                print(">>> Checking file", file)
-            check_markdown_file(root, file,
-                                raspibackupdoc=raspibackupdoc,
-                                external_links=external_links)
+             external_links=None, diagnostics=None,
+             verbose=False) -> None:
+    """Traverse given directory and check Markdown files
+
+    The files are checked in parallel by a thread pool: the work
+    is mostly waiting for stat() calls and small reads, so threads
+    hide the I/O latency nicely.
+    """
+
+    _exists.cache_clear()
+    _read.cache_clear()
+    _anchors_of.cache_clear()
+
+    md_files = [Path(p) for p in _iter_md_files(str(directory))]
+
+    if verbose:
+        for file in md_files:
+            print(">>> Checking file", file)
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as executor:
+        results = executor.map(
+            lambda file: check_markdown_file(file.parent, file,
+                                             raspibackupdoc=raspibackupdoc),
+            md_files)
+
+    for links, diags in results:
+        external_links.update(links)
+        diagnostics.extend(diags)
 
 
 def print_external_links(links):
-    """Print the list of external - unchecked - links """
+    """Print the set of external - unchecked - links, sorted """
 
     print("\n\n*** Info: Not checked external link(s) ***\n")
     for linkdata in sorted(links):
@@ -172,11 +291,15 @@ def main(args):
 
     print("*** Check project-internal links ***\n")
 
-    external_links: List[tuple] = []
+    external_links: set[tuple] = set()
+    diagnostics: List[str] = []
 
     for srcdir in args.pathes:
         walk_dir(srcdir, raspibackupdoc=args.raspiBackupDoc,
-                 external_links=external_links, verbose=args.verbose)
+                 external_links=external_links, diagnostics=diagnostics,
+                 verbose=args.verbose)
+
+    sys.stdout.writelines(diagnostics)
 
     if external_links and args.show_external_links:
         print_external_links(external_links)
@@ -186,6 +309,8 @@ def main(args):
 
 if __name__ == "__main__":
 
+    import argparse
+
     parser = argparse.ArgumentParser(
                     prog='mdlinkcheck.py',
                     formatter_class=argparse.RawDescriptionHelpFormatter,